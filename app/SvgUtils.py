@@ -1,4 +1,3 @@
-import base64
 import logging
 import math
 import os
@@ -7,16 +6,31 @@ import subprocess
 import tempfile
 from uuid import uuid4
 
+import pybase64 as base64
+
 IMAGE_PNG = 'image/png'
 IMAGE_SVG = 'image/svg+xml'
 
 NON_SVG_CONTENT_TYPES = ('image/jpeg', 'image/png', 'image/gif')
 
+PX_CONVERSION_RATIOS = {
+    'px': 1,
+    'pt': 4 / 3,
+    'in': 96,
+    'cm': 96 / 2.54,
+    'mm': 96 / 2.54 * 10,
+    'pc': 16,
+}
+
+SVG_WIDTH_PATTERN = re.compile(r'<svg[^>]+?width="(?P<width>[\d.]+)(?P<unit>\w+)?')
+SVG_HEIGHT_PATTERN = re.compile(r'<svg[^>]+?height="(?P<height>[\d.]+)(?P<unit>\w+)?')
+
+IMG_BASE64_PATTERN = re.compile(r'<img(?P<intermediate>[^>]+?src="data:)(?P<type>[^;>]*?);base64,\s?(?P<base64>[^">]*?)"')
+
 
 # Process img tags, replacing base64 SVG images with PNGs
 def process_svg(html):
-    pattern = re.compile(r'<img(?P<intermediate>[^>]+?src="data:)(?P<type>[^;>]*?);base64,\s?(?P<base64>[^">]*?)"')
-    return re.sub(pattern, replace_img_base64, html)
+    return IMG_BASE64_PATTERN.sub(replace_img_base64, html)
 
 
 # Decode and validate if the provided content is SVG.
@@ -83,8 +97,8 @@ def replace_svg_with_png(svg_content):
 
 # Extract the width and height from the SVG tag (and convert it to px)
 def extract_svg_dimensions_as_px(svg_content):
-    width_match = re.search(r'<svg[^>]+?width="(?P<width>[\d.]+)(?P<unit>\w+)?', svg_content)
-    height_match = re.search(r'<svg[^>]+?height="(?P<height>[\d.]+)(?P<unit>\w+)?', svg_content)
+    width_match = SVG_WIDTH_PATTERN.search(svg_content)
+    height_match = SVG_HEIGHT_PATTERN.search(svg_content)
 
     width = width_match.group('width') if width_match else None
     height = height_match.group('height') if height_match else None
@@ -186,17 +200,4 @@ def convert_to_px(value, unit):
         logging.error(f"Invalid value for conversion: {value}")
         return None
 
-    if unit == 'px':
-        return math.ceil(value)
-    elif unit == 'pt':
-        return math.ceil(value * 4 / 3)
-    elif unit == 'in':
-        return math.ceil(value * 96)
-    elif unit == 'cm':
-        return math.ceil(value * 96 / 2.54)
-    elif unit == 'mm':
-        return math.ceil(value * 96 / 2.54 * 10)
-    elif unit == 'pc':
-        return math.ceil(value * 16)
-    else:
-        return math.ceil(value) # Unknown unit, assume px
+    return math.ceil(value * PX_CONVERSION_RATIOS.get(unit, 1))  # Unknown unit, assume px